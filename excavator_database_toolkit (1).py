@@ -19,14 +19,15 @@ License: MIT
 
 import pandas as pd
 import numpy as np
+import copy
 import json
-import xml.etree.ElementTree as ET
-from xml.dom import minidom
+from xml.sax.saxutils import escape
 import sqlite3
 from pathlib import Path
 import datetime
 import logging
 from typing import Dict, List, Optional, Union, Any
+from concurrent.futures import ThreadPoolExecutor
 import argparse
 import sys
 import os
@@ -50,34 +51,141 @@ except ImportError:
     MATPLOTLIB_AVAILABLE = False
 
 try:
-    from flask import Flask, jsonify, request
+    from flask import Flask, Response, jsonify, request
     from flask_cors import CORS
     FLASK_AVAILABLE = True
 except ImportError:
     FLASK_AVAILABLE = False
 
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    POLARS_AVAILABLE = False
+
+try:
+    import pyarrow
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    import python_calamine
+    CALAMINE_AVAILABLE = True
+except ImportError:
+    CALAMINE_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 try:
     import requests
     REQUESTS_AVAILABLE = True
 except ImportError:
     REQUESTS_AVAILABLE = False
 
+# Keyword arguments accepted by ExcavatorDatabase.search()
+SEARCH_FILTERS = ('manufacturer', 'model', 'pin_diameter_min', 'pin_diameter_max', 'data_source')
+
+# Weight classes by stick pin diameter; edges are inclusive upper bounds in mm
+WEIGHT_CLASSES = [
+    "Mini (< 6 tons)",
+    "Compact (6-15 tons)",
+    "Medium (15-30 tons)",
+    "Large (30-50 tons)",
+    "Heavy (50-80 tons)",
+    "Ultra Heavy (> 80 tons)"
+]
+WEIGHT_CLASS_EDGES_MM = np.array([30, 45, 65, 90, 120])
+
+def _pin_stats(values, edges):
+    """Single pass over pin diameters: min, max, sum, count and weight-class counts (NaN skipped)"""
+    counts = np.zeros(len(edges) + 1, dtype=np.int64)
+    lo = np.inf
+    hi = -np.inf
+    total = 0.0
+    n = 0
+    for x in values:
+        if np.isnan(x):
+            continue
+        lo = min(lo, x)
+        hi = max(hi, x)
+        total += x
+        n += 1
+        i = 0
+        while i < len(edges) and x > edges[i]:
+            i += 1
+        counts[i] += 1
+    return lo, hi, total, n, counts
+
+if NUMBA_AVAILABLE:
+    _pin_stats = njit(cache=True)(_pin_stats)
+
+def _is_text(values: pd.Series) -> bool:
+    """True when a column (or a categorical's categories) holds strings and supports .str"""
+    dtype = values.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        dtype = dtype.categories.dtype
+    return pd.api.types.is_string_dtype(dtype)
+
+# Extra entities escaped in XML text nodes (matches minidom output)
+_XML_ENTITIES = {'"': '&quot;'}
+
+# Rows serialized per write by ExcavatorDatabase.export_xml()
+XML_CHUNK_ROWS = 10000
+
+
+def _json_records(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Row dicts for JSON output, with missing values as None so they serialize as null"""
+    if ORJSON_AVAILABLE:
+        # orjson already writes NaN as null
+        return df.to_dict('records')
+    return df.astype(object).where(df.notna(), None).to_dict('records')
+
+
+def _dumps(data: Any, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON with orjson when available, else the stdlib json module"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if indent else 0))
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
 class ExcavatorDatabase:
     """
     Main class for managing excavator pin dimensions database
     """
     
-    def __init__(self, data_file: Optional[str] = None):
+    def __init__(self, data_file: Optional[str] = None, engine: str = 'pandas'):
         """
         Initialize the excavator database
         
         Args:
             data_file: Path to the main database file (CSV or Excel)
+            engine: Query engine, 'pandas' or 'polars' (lazy scan of CSV files)
         """
+        if engine not in ('pandas', 'polars'):
+            raise ValueError(f"Unsupported engine: {engine}")
+        if engine == 'polars' and not POLARS_AVAILABLE:
+            raise ImportError("Polars not available. Install with: pip install polars pyarrow")
+        
         self.data_file = data_file
+        self.engine = engine
         self.df = None
+        self.lf = None
+        self._lf_key = None   # _cache_key() of the frame self.lf was loaded with
         self.logger = self._setup_logging()
         
+        # Memoized results of the read-only analysis methods, see _cache_key()
+        self._stats_cache = {}
+        
         # Database schema
         self.required_columns = [
             'Manufacturer', 'Model', 'Stick_Pin_Diameter_mm', 'Stick_Pin_Diameter_inch',
@@ -102,12 +210,56 @@ class ExcavatorDatabase:
         )
         return logging.getLogger(__name__)
     
-    def load_data(self, file_path: str) -> bool:
+    def _cache_key(self, name: str) -> tuple:
+        """Cache key for analysis results, tied to the identity of the loaded DataFrame"""
+        return (name, id(self.df), 0 if self.df is None else len(self.df))
+    
+    def _derived(self, name: str, build) -> Any:
+        """State derived from self.df, memoized under _cache_key() so it follows reassignment of df"""
+        key = self._cache_key(name)
+        if key not in self._stats_cache:
+            self._stats_cache[key] = build(self.df)
+        return self._stats_cache[key]
+    
+    @property
+    def _mfg_counts(self) -> pd.Series:
+        """Manufacturer value counts shared by statistics, exports and charts"""
+        return self._derived('value_counts', self._build_counts)[0]
+    
+    @property
+    def _source_counts(self) -> pd.Series:
+        """Data source value counts"""
+        return self._derived('value_counts', self._build_counts)[1]
+    
+    @property
+    def _n_mfg(self) -> int:
+        """Number of distinct manufacturers"""
+        return int(self._mfg_counts.size)
+    
+    @property
+    def _lf(self) -> Optional['pl.LazyFrame']:
+        """The Polars frame, or None once self.df has been replaced by a frame it does not mirror"""
+        if self.lf is None or self._lf_key != self._cache_key('lf'):
+            return None
+        return self.lf
+    
+    @property
+    def _search_columns(self) -> Dict[str, Any]:
+        """Lowercased text columns (or categories) used by search()"""
+        return self._derived('search_columns', self._build_search_index)
+    
+    @property
+    def _mfg_model_hash(self) -> np.ndarray:
+        """Per-row hash of (Manufacturer, Model) for duplicate checks"""
+        return self._derived('mfg_model_hash', self._hash_mfg_model)
+    
+    def load_data(self, file_path: str, chunksize: Optional[int] = None) -> bool:
         """
         Load excavator data from file
         
         Args:
             file_path: Path to data file (CSV or Excel)
+            chunksize: Read CSV files in chunks of this many rows to bound parser memory
             
         Returns:
             bool: Success status
@@ -115,13 +267,40 @@ class ExcavatorDatabase:
         try:
             file_path = Path(file_path)
             
-            if file_path.suffix.lower() == '.csv':
-                self.df = pd.read_csv(file_path)
+            lf = None
+            if file_path.suffix.lower() == '.csv' and self.engine == 'polars':
+                # Parse once, inferring types from every row and keeping measurements numeric
+                # even when empty (Polars would read them as str); queries then run lazily over
+                # the in-memory frame and the pandas copy serves exports and plots
+                collected = pl.read_csv(file_path, infer_schema_length=None)
+                measurements = [c for c in collected.columns if c.endswith(('_mm', '_inch'))]
+                collected = collected.with_columns(pl.col(measurements).cast(pl.Float64))
+                lf = collected.lazy()
+                df = collected.to_pandas()
+            elif file_path.suffix.lower() == '.csv' and chunksize:
+                # The pyarrow engine has no chunked reader, so use the C engine here
+                chunks = pd.read_csv(file_path, chunksize=chunksize)
+                df = pd.concat(chunks, ignore_index=True)
+            elif file_path.suffix.lower() == '.csv':
+                # Multithreaded Arrow parser when available; NumPy-backed dtypes either way
+                df = pd.read_csv(file_path, engine='pyarrow' if PYARROW_AVAILABLE else 'c')
+                if PYARROW_AVAILABLE and df.empty:
+                    # pyarrow types the columns of a header-only file as float64; the C
+                    # engine (and the rest of the toolkit) expects object columns there
+                    df = df.astype(object)
             elif file_path.suffix.lower() in ['.xlsx', '.xls']:
-                self.df = pd.read_excel(file_path)
+                df = pd.read_excel(file_path, engine='calamine' if CALAMINE_AVAILABLE else None)
             else:
                 raise ValueError(f"Unsupported file format: {file_path.suffix}")
             
+            # Prepare the new frame before swapping it in, so a failure leaves the previously
+            # loaded data untouched; everything derived from it is built lazily via _derived()
+            self._compact_dtypes(df)
+            
+            self.df = df
+            self.lf = lf
+            self._lf_key = self._cache_key('lf')
+            self._stats_cache.clear()
             self.logger.info(f"Loaded {len(self.df)} records from {file_path}")
             return True
             
@@ -129,6 +308,60 @@ class ExcavatorDatabase:
             self.logger.error(f"Error loading data: {e}")
             return False
     
+    @staticmethod
+    def _compact_dtypes(df: pd.DataFrame):
+        """Store measurements and repeated labels in narrower dtypes where lossless"""
+        for col in df.columns:
+            # Only integer columns are narrowed; float columns keep float64 so exports
+            # still write e.g. 30.0 rather than 30
+            if col.endswith(('_mm', '_inch')) and df[col].dtype.kind in 'iu':
+                df[col] = pd.to_numeric(df[col], downcast='integer')
+        
+        # Few distinct values repeated across many rows; Model is near-unique so stays as text.
+        # Categories keep first-appearance order so value_counts() ties rank as for plain text.
+        for col in ('Manufacturer', 'Data_Source', 'Notes'):
+            if col in df.columns and _is_text(df[col]):
+                categories = pd.unique(df[col].dropna())
+                df[col] = df[col].astype(pd.CategoricalDtype(categories))
+    
+    @staticmethod
+    def _build_search_index(df: pd.DataFrame) -> Dict[str, Any]:
+        """Precompute lowercased text so search() can match without case folding
+        
+        Categorical columns only need their (few) categories lowercased; matches are
+        mapped back to rows through the category codes. Columns without text (e.g. an
+        all-empty column read as float64) are left to the fallback in _contains().
+        """
+        search_columns = {}
+        for col in ('Manufacturer', 'Model', 'Data_Source'):
+            if col not in df.columns or not _is_text(df[col]):
+                continue
+            if isinstance(df[col].dtype, pd.CategoricalDtype):
+                search_columns[col] = df[col].cat.categories.str.lower()
+            else:
+                search_columns[col] = df[col].str.lower()
+        return search_columns
+    
+    @staticmethod
+    def _build_counts(df: pd.DataFrame) -> tuple:
+        """Precompute manufacturer and data source value counts"""
+        if 'Manufacturer' in df.columns:
+            mfg_counts = df['Manufacturer'].value_counts()
+        else:
+            mfg_counts = pd.Series(dtype=int)
+        if 'Data_Source' in df.columns:
+            source_counts = df['Data_Source'].value_counts()
+        else:
+            source_counts = pd.Series(dtype=int)
+        return mfg_counts, source_counts
+    
+    @staticmethod
+    def _hash_mfg_model(df: pd.DataFrame) -> np.ndarray:
+        """Per-row hash of (Manufacturer, Model); empty when either column is missing"""
+        if not {'Manufacturer', 'Model'}.issubset(df.columns):
+            return np.empty(0, dtype=np.uint64)
+        return pd.util.hash_pandas_object(df[['Manufacturer', 'Model']], index=False).to_numpy()
+    
     def validate_data(self) -> Dict[str, Any]:
         """
         Validate database integrity and quality
@@ -139,6 +372,10 @@ class ExcavatorDatabase:
         if self.df is None:
             return {"error": "No data loaded"}
         
+        key = self._cache_key('validate_data')
+        if key in self._stats_cache:
+            return copy.deepcopy(self._stats_cache[key])
+        
         results = {
             "total_records": len(self.df),
             "missing_columns": [],
@@ -149,18 +386,16 @@ class ExcavatorDatabase:
         }
         
         # Check required columns
-        for col in self.required_columns:
-            if col not in self.df.columns:
-                results["missing_columns"].append(col)
-        
-        # Check missing values
-        for col in self.df.columns:
-            missing_count = self.df[col].isnull().sum()
-            if missing_count > 0:
-                results["missing_values"][col] = missing_count
-        
-        # Check duplicates
-        duplicates = self.df.duplicated(subset=['Manufacturer', 'Model']).sum()
+        present = set(self.df.columns)
+        results["missing_columns"] = [col for col in self.required_columns if col not in present]
+        
+        # Check missing values (one scan over the whole frame)
+        missing = self.df.isnull().sum()
+        results["missing_values"] = {col: int(n) for col, n in missing.items() if n > 0}
+        
+        # Check duplicates: every repeat of a (Manufacturer, Model) hash beyond the first
+        _, counts = np.unique(self._mfg_model_hash, return_counts=True)
+        duplicates = int((counts - 1).sum())
         results["duplicate_records"] = duplicates
         
         # Calculate quality score
@@ -176,6 +411,8 @@ class ExcavatorDatabase:
         if results["data_quality_score"] < 90:
             results["issues"].append(f"Data quality score below 90%: {results['data_quality_score']}%")
         
+        # Callers get their own copy so mutating a result cannot alter the cache
+        self._stats_cache[key] = copy.deepcopy(results)
         return results
     
     def get_statistics(self) -> Dict[str, Any]:
@@ -188,10 +425,17 @@ class ExcavatorDatabase:
         if self.df is None:
             return {"error": "No data loaded"}
         
+        key = self._cache_key('get_statistics')
+        if key in self._stats_cache:
+            stats = copy.deepcopy(self._stats_cache[key])
+            # Only the timestamp changes between calls on the same data
+            stats["overview"]["date_generated"] = datetime.datetime.now().isoformat()
+            return stats
+        
         stats = {
             "overview": {
                 "total_records": len(self.df),
-                "total_manufacturers": self.df['Manufacturer'].nunique(),
+                "total_manufacturers": self._n_mfg,
                 "date_generated": datetime.datetime.now().isoformat()
             },
             "manufacturers": {},
@@ -201,48 +445,79 @@ class ExcavatorDatabase:
         }
         
         # Manufacturer statistics
-        manufacturer_counts = self.df['Manufacturer'].value_counts()
-        stats["manufacturers"] = manufacturer_counts.to_dict()
+        stats["manufacturers"] = self._mfg_counts.to_dict()
         
         # Pin diameter distribution
-        if 'Stick_Pin_Diameter_mm' in self.df.columns:
-            pin_diameters = self.df['Stick_Pin_Diameter_mm'].dropna()
+        if self._lf is not None and 'Stick_Pin_Diameter_mm' in self.df.columns:
+            stats["pin_diameter_distribution"] = self._polars_pin_distribution()
+        elif 'Stick_Pin_Diameter_mm' in self.df.columns:
+            summary = self._pin_summary()
             stats["pin_diameter_distribution"] = {
-                "min": float(pin_diameters.min()),
-                "max": float(pin_diameters.max()),
-                "mean": float(pin_diameters.mean()),
-                "median": float(pin_diameters.median())
+                k: summary[k] for k in ("min", "max", "mean", "median")
             }
         
         # Data sources
         if 'Data_Source' in self.df.columns:
-            source_counts = self.df['Data_Source'].value_counts()
-            stats["data_sources"] = source_counts.to_dict()
+            stats["data_sources"] = self._source_counts.to_dict()
         
         # Weight classes based on pin diameter
         if 'Stick_Pin_Diameter_mm' in self.df.columns:
             weight_classes = self._classify_by_weight()
             stats["weight_classes"] = weight_classes
         
+        self._stats_cache[key] = copy.deepcopy(stats)
         return stats
     
+    def _polars_pin_distribution(self) -> Dict[str, float]:
+        """Pin diameter min/max/mean/median from a single lazy Polars scan"""
+        pin = pl.col('Stick_Pin_Diameter_mm').drop_nulls()
+        row = self._lf.select(
+            pin.min().alias('min'),
+            pin.max().alias('max'),
+            pin.mean().alias('mean'),
+            pin.median().alias('median')
+        ).collect().row(0, named=True)
+        return {k: float('nan') if v is None else float(v) for k, v in row.items()}
+    
     def _classify_by_weight(self) -> Dict[str, int]:
         """Classify excavators by weight class based on pin diameter"""
         if 'Stick_Pin_Diameter_mm' not in self.df.columns:
             return {}
         
-        pin_diameters = self.df['Stick_Pin_Diameter_mm'].dropna()
+        key = self._cache_key('_classify_by_weight')
+        if key in self._stats_cache:
+            return dict(self._stats_cache[key])
         
-        classes = {
-            "Mini (< 6 tons)": (pin_diameters <= 30).sum(),
-            "Compact (6-15 tons)": ((pin_diameters > 30) & (pin_diameters <= 45)).sum(),
-            "Medium (15-30 tons)": ((pin_diameters > 45) & (pin_diameters <= 65)).sum(),
-            "Large (30-50 tons)": ((pin_diameters > 65) & (pin_diameters <= 90)).sum(),
-            "Heavy (50-80 tons)": ((pin_diameters > 90) & (pin_diameters <= 120)).sum(),
-            "Ultra Heavy (> 80 tons)": (pin_diameters > 120).sum()
-        }
+        counts = self._pin_summary()["class_counts"]
+        self._stats_cache[key] = {label: int(n) for label, n in zip(WEIGHT_CLASSES, counts)}
+        return dict(self._stats_cache[key])
+    
+    def _pin_summary(self) -> Dict[str, Any]:
+        """Stick pin diameter summary and weight-class counts, computed in one pass"""
+        key = self._cache_key('_pin_summary')
+        if key in self._stats_cache:
+            return self._stats_cache[key]
+        
+        values = self.df['Stick_Pin_Diameter_mm'].to_numpy(dtype=float)
+        present = values[~np.isnan(values)]
+        
+        if NUMBA_AVAILABLE:
+            lo, hi, total, n, counts = _pin_stats(values, WEIGHT_CLASS_EDGES_MM.astype(float))
+        else:
+            n = present.size
+            lo, hi, total = (present.min(), present.max(), present.sum()) if n else (np.nan, np.nan, 0.0)
+            # Class i holds diameters in (edge[i-1], edge[i]]
+            class_idx = np.digitize(present, WEIGHT_CLASS_EDGES_MM, right=True)
+            counts = np.bincount(class_idx, minlength=len(WEIGHT_CLASSES))
         
-        return {k: int(v) for k, v in classes.items()}
+        self._stats_cache[key] = {
+            "min": float(lo) if n else float('nan'),
+            "max": float(hi) if n else float('nan'),
+            "mean": float(total / n) if n else float('nan'),
+            "median": float(np.median(present)) if n else float('nan'),
+            "class_counts": counts
+        }
+        return self._stats_cache[key]
     
     def search(self, **kwargs) -> pd.DataFrame:
         """
@@ -256,33 +531,71 @@ class ExcavatorDatabase:
             data_source: Data source filter
             
         Returns:
-            pd.DataFrame: Filtered results
+            pd.DataFrame: Filtered results. With no filters this is the loaded
+            DataFrame itself, so callers must treat the result as read-only.
         """
         if self.df is None:
             return pd.DataFrame()
         
-        result = self.df.copy()
+        if not any(kwargs.get(k) for k in SEARCH_FILTERS):
+            return self.df
+        
+        if self._lf is not None:
+            return self.df.loc[self._polars_mask(**kwargs)]
+        
+        mask = np.ones(len(self.df), dtype=bool)
         
         # Filter by manufacturer
         if 'manufacturer' in kwargs and kwargs['manufacturer']:
-            result = result[result['Manufacturer'].str.contains(kwargs['manufacturer'], case=False, na=False)]
+            mask &= self._contains('Manufacturer', kwargs['manufacturer'])
         
         # Filter by model
         if 'model' in kwargs and kwargs['model']:
-            result = result[result['Model'].str.contains(kwargs['model'], case=False, na=False)]
+            mask &= self._contains('Model', kwargs['model'])
         
         # Filter by pin diameter range
         if 'pin_diameter_min' in kwargs and kwargs['pin_diameter_min']:
-            result = result[result['Stick_Pin_Diameter_mm'] >= kwargs['pin_diameter_min']]
+            mask &= self.df['Stick_Pin_Diameter_mm'].to_numpy(dtype=float) >= kwargs['pin_diameter_min']
         
         if 'pin_diameter_max' in kwargs and kwargs['pin_diameter_max']:
-            result = result[result['Stick_Pin_Diameter_mm'] <= kwargs['pin_diameter_max']]
+            mask &= self.df['Stick_Pin_Diameter_mm'].to_numpy(dtype=float) <= kwargs['pin_diameter_max']
         
         # Filter by data source
         if 'data_source' in kwargs and kwargs['data_source']:
-            result = result[result['Data_Source'].str.contains(kwargs['data_source'], case=False, na=False)]
+            mask &= self._contains('Data_Source', kwargs['data_source'])
+        
+        return self.df.loc[mask]
+    
+    def _contains(self, column: str, text: str) -> np.ndarray:
+        """Case-insensitive substring match of a text column as a boolean array"""
+        lowered = self._search_columns.get(column)
+        if lowered is None:
+            if not _is_text(self.df[column]):
+                # No strings in the column (e.g. entirely empty), so nothing can match
+                return np.zeros(len(self.df), dtype=bool)
+            lowered = self.df[column].str.lower()
         
-        return result
+        if isinstance(lowered, pd.Index):
+            # Match the categories, then expand by code; the trailing False catches code -1 (NaN)
+            hits = np.asarray(lowered.str.contains(text.lower(), regex=False, na=False), dtype=bool)
+            return np.append(hits, False)[self.df[column].cat.codes.to_numpy()]
+        return lowered.str.contains(text.lower(), regex=False, na=False).to_numpy(dtype=bool)
+    
+    def _polars_mask(self, **kwargs) -> np.ndarray:
+        """Evaluate the search() filters as one fused lazy Polars expression"""
+        conditions = [
+            pl.col(column).str.to_lowercase().str.contains(kwargs[arg].lower(), literal=True)
+            for arg, column in (('manufacturer', 'Manufacturer'), ('model', 'Model'),
+                                ('data_source', 'Data_Source'))
+            if kwargs.get(arg)
+        ]
+        if kwargs.get('pin_diameter_min'):
+            conditions.append(pl.col('Stick_Pin_Diameter_mm') >= kwargs['pin_diameter_min'])
+        if kwargs.get('pin_diameter_max'):
+            conditions.append(pl.col('Stick_Pin_Diameter_mm') <= kwargs['pin_diameter_max'])
+        
+        combined = pl.all_horizontal(conditions).fill_null(False)
+        return self._lf.select(combined).collect().to_series().to_numpy()
     
     def export_csv(self, output_path: str) -> bool:
         """Export database to CSV format"""
@@ -290,7 +603,12 @@ class ExcavatorDatabase:
             if self.df is None:
                 raise ValueError("No data loaded")
             
-            self.df.to_csv(output_path, index=False)
+            if self._lf is not None:
+                self._lf.sink_csv(output_path)
+            else:
+                # Large buffer and chunked serialization keep write() calls and peak memory down
+                with open(output_path, 'w', encoding='utf-8', newline='', buffering=1 << 20) as f:
+                    self.df.to_csv(f, index=False, chunksize=100000)
             self.logger.info(f"Exported {len(self.df)} records to {output_path}")
             return True
             
@@ -335,19 +653,18 @@ class ExcavatorDatabase:
             if self.df is None:
                 raise ValueError("No data loaded")
             
-            # Convert DataFrame to JSON with metadata
             data = {
                 "metadata": {
                     "total_records": len(self.df),
-                    "total_manufacturers": self.df['Manufacturer'].nunique(),
+                    "total_manufacturers": self._n_mfg,
                     "export_date": datetime.datetime.now().isoformat(),
                     "version": "2024.1"
                 },
-                "excavators": self.df.to_dict('records')
+                "excavators": _json_records(self.df)
             }
             
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            with open(output_path, 'wb') as f:
+                f.write(_dumps(data, indent=True))
             
             self.logger.info(f"Exported {len(self.df)} records to {output_path}")
             return True
@@ -362,33 +679,45 @@ class ExcavatorDatabase:
             if self.df is None:
                 raise ValueError("No data loaded")
             
-            # Create root element
-            root = ET.Element("ExcavatorDatabase")
-            
-            # Add metadata
-            metadata = ET.SubElement(root, "Metadata")
-            ET.SubElement(metadata, "TotalRecords").text = str(len(self.df))
-            ET.SubElement(metadata, "TotalManufacturers").text = str(self.df['Manufacturer'].nunique())
-            ET.SubElement(metadata, "ExportDate").text = datetime.datetime.now().isoformat()
-            ET.SubElement(metadata, "Version").text = "2024.1"
+            # Per-column tags are fixed, so build them once instead of per cell
+            tags = [col.replace(' ', '_') for col in self.df.columns]
+            open_tags = [f"      <{tag}>" for tag in tags]
+            close_tags = [f"</{tag}>" for tag in tags]
+            empty_tags = [f"      <{tag}/>" for tag in tags]
             
-            # Add excavators
-            excavators = ET.SubElement(root, "Excavators")
+            header = "\n".join([
+                '<?xml version="1.0" ?>',
+                "<ExcavatorDatabase>",
+                "  <Metadata>",
+                f"    <TotalRecords>{len(self.df)}</TotalRecords>",
+                f"    <TotalManufacturers>{self._n_mfg}</TotalManufacturers>",
+                f"    <ExportDate>{datetime.datetime.now().isoformat()}</ExportDate>",
+                "    <Version>2024.1</Version>",
+                "  </Metadata>",
+                "  <Excavators>" if len(self.df) else "  <Excavators/>",
+            ])
+            footer = "  </Excavators>\n</ExcavatorDatabase>" if len(self.df) else "</ExcavatorDatabase>"
             
-            for _, row in self.df.iterrows():
-                excavator = ET.SubElement(excavators, "Excavator")
+            with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                f.write(header)
+                f.write("\n")
                 
-                for col in self.df.columns:
-                    element = ET.SubElement(excavator, col.replace(' ', '_'))
-                    element.text = str(row[col]) if pd.notna(row[col]) else ""
-            
-            # Create pretty XML
-            xml_str = minidom.parseString(ET.tostring(root)).toprettyxml(indent="  ")
-            xml_lines = [line for line in xml_str.split('\n') if line.strip()]
-            xml_str = '\n'.join(xml_lines)
-            
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(xml_str)
+                # Stream fixed-size row blocks so only one block is ever held as strings
+                for start in range(0, len(self.df), XML_CHUNK_ROWS):
+                    chunk = self.df.iloc[start:start + XML_CHUNK_ROWS]
+                    # Stringify the block in one vectorized pass; missing cells become ""
+                    values = chunk.astype(str).where(chunk.notna(), '').to_numpy(dtype=object).tolist()
+                    f.write("".join(
+                        "    <Excavator>\n"
+                        + "\n".join(
+                            f"{o}{escape(v, _XML_ENTITIES)}{c}" if v else e
+                            for o, c, e, v in zip(open_tags, close_tags, empty_tags, row)
+                        )
+                        + "\n    </Excavator>\n"
+                        for row in values
+                    ))
+                
+                f.write(footer)
             
             self.logger.info(f"Exported {len(self.df)} records to {output_path}")
             return True
@@ -442,18 +771,15 @@ class ExcavatorDatabase:
             # Main data table (first 100 records)
             df_sample = self.df.head(100)
             
-            # Prepare table data
-            table_data = [['Manufacturer', 'Model', 'Pin Ø (mm)', 'Pin Ø (in)', 'Stick W (mm)', 'Link W (mm)']]
+            # Prepare table data, formatting all cells in one vectorized pass
+            # (labels are printed as-is, missing measurements as '-')
+            measurements = ['Stick_Pin_Diameter_mm', 'Stick_Pin_Diameter_inch', 'Stick_Width_mm', 'Link_Width_mm']
+            labels = df_sample[['Manufacturer', 'Model']].apply(lambda col: col.map(str).str.slice(0, 15))
+            sub = df_sample[measurements]
+            cells = pd.concat([labels, sub.astype(str).where(sub.notna(), '-')], axis=1)
             
-            for _, row in df_sample.iterrows():
-                table_data.append([
-                    str(row['Manufacturer'])[:15],
-                    str(row['Model'])[:15],
-                    str(row['Stick_Pin_Diameter_mm']) if pd.notna(row['Stick_Pin_Diameter_mm']) else '-',
-                    str(row['Stick_Pin_Diameter_inch']) if pd.notna(row['Stick_Pin_Diameter_inch']) else '-',
-                    str(row['Stick_Width_mm']) if pd.notna(row['Stick_Width_mm']) else '-',
-                    str(row['Link_Width_mm']) if pd.notna(row['Link_Width_mm']) else '-'
-                ])
+            table_data = [['Manufacturer', 'Model', 'Pin Ø (mm)', 'Pin Ø (in)', 'Stick W (mm)', 'Link W (mm)']]
+            table_data.extend(cells.to_numpy(dtype=object).tolist())
             
             table = Table(table_data)
             table.setStyle(TableStyle([
@@ -486,16 +812,23 @@ class ExcavatorDatabase:
             
             conn = sqlite3.connect(db_path)
             
-            # Create main table
-            self.df.to_sql('excavators', conn, if_exists='replace', index=False)
+            # One-shot bulk build: skip fsyncs and keep the rollback journal in memory
+            conn.executescript(
+                "PRAGMA journal_mode=MEMORY; PRAGMA synchronous=OFF; "
+                "PRAGMA temp_store=MEMORY; PRAGMA cache_size=-65536;"
+            )
             
-            # Create indexes for better performance
-            cursor = conn.cursor()
-            cursor.execute('CREATE INDEX idx_manufacturer ON excavators(Manufacturer)')
-            cursor.execute('CREATE INDEX idx_model ON excavators(Model)')
-            cursor.execute('CREATE INDEX idx_pin_diameter ON excavators(Stick_Pin_Diameter_mm)')
+            # Create main table (batched executemany inside one transaction)
+            self.df.to_sql('excavators', conn, if_exists='replace', index=False, chunksize=1000)
+            
+            # Create indexes after the bulk load, in a single transaction (sqlite3 does not
+            # open one implicitly before DDL, so begin it explicitly)
+            with conn:
+                conn.execute('BEGIN')
+                conn.execute('CREATE INDEX idx_manufacturer ON excavators(Manufacturer)')
+                conn.execute('CREATE INDEX idx_model ON excavators(Model)')
+                conn.execute('CREATE INDEX idx_pin_diameter ON excavators(Stick_Pin_Diameter_mm)')
             
-            conn.commit()
             conn.close()
             
             self.logger.info(f"Created SQLite database with {len(self.df)} records at {db_path}")
@@ -524,7 +857,7 @@ class ExcavatorDatabase:
             
             # 1. Manufacturer distribution
             plt.figure(figsize=(12, 8))
-            manufacturer_counts = self.df['Manufacturer'].value_counts().head(15)
+            manufacturer_counts = self._mfg_counts.head(15)
             manufacturer_counts.plot(kind='bar')
             plt.title('Top 15 Manufacturers by Model Count')
             plt.xlabel('Manufacturer')
@@ -607,11 +940,7 @@ class ExcavatorAPI:
                 # Limit results
                 results = results.head(limit)
                 
-                return jsonify({
-                    'success': True,
-                    'count': len(results),
-                    'data': results.to_dict('records')
-                })
+                return self._records_response(results)
                 
             except Exception as e:
                 return jsonify({'success': False, 'error': str(e)}), 500
@@ -655,15 +984,17 @@ class ExcavatorAPI:
                 search_params = request.get_json()
                 results = self.database.search(**search_params)
                 
-                return jsonify({
-                    'success': True,
-                    'count': len(results),
-                    'data': results.to_dict('records')
-                })
+                return self._records_response(results)
                 
             except Exception as e:
                 return jsonify({'success': False, 'error': str(e)}), 500
     
+    @staticmethod
+    def _records_response(results: pd.DataFrame) -> 'Response':
+        """JSON response for a result set, serialized by orjson when available"""
+        body = _dumps({'success': True, 'count': len(results), 'data': _json_records(results)})
+        return Response(body, mimetype='application/json')
+    
     def run(self, host='0.0.0.0', port=5000, debug=False):
         """Run the API server"""
         self.app.run(host=host, port=port, debug=debug)
@@ -672,6 +1003,8 @@ def main():
     """Main CLI interface"""
     parser = argparse.ArgumentParser(description='Excavator Pin Dimensions Database Toolkit')
     parser.add_argument('--data', '-d', help='Path to data file (CSV or Excel)')
+    parser.add_argument('--engine', choices=['pandas', 'polars'], default='pandas',
+                       help='Query engine for loading and searching CSV data')
     parser.add_argument('--output', '-o', help='Output directory', default='./output')
     parser.add_argument('--format', '-f', choices=['csv', 'excel', 'json', 'xml', 'pdf', 'sqlite', 'all'], 
                        default='csv', help='Export format')
@@ -686,7 +1019,7 @@ def main():
     args = parser.parse_args()
     
     # Initialize database
-    db = ExcavatorDatabase(args.data)
+    db = ExcavatorDatabase(args.data, engine=args.engine)
     
     if db.df is None:
         print("Error: No data loaded. Please provide a valid data file with --data")
@@ -720,29 +1053,24 @@ def main():
             print(results[['Manufacturer', 'Model', 'Stick_Pin_Diameter_mm']].head(10))
     
     # Export data
-    if args.format in ['csv', 'all']:
-        print("Exporting to CSV...")
-        db.export_csv(output_dir / 'excavator_database.csv')
-    
-    if args.format in ['excel', 'all']:
-        print("Exporting to Excel...")
-        db.export_excel(output_dir / 'excavator_database.xlsx')
-    
-    if args.format in ['json', 'all']:
-        print("Exporting to JSON...")
-        db.export_json(output_dir / 'excavator_database.json')
-    
-    if args.format in ['xml', 'all']:
-        print("Exporting to XML...")
-        db.export_xml(output_dir / 'excavator_database.xml')
-    
-    if args.format in ['pdf', 'all']:
-        print("Exporting to PDF...")
-        db.export_pdf(output_dir / 'excavator_database.pdf')
+    exports = [
+        ('csv', "Exporting to CSV...", db.export_csv, 'excavator_database.csv'),
+        ('excel', "Exporting to Excel...", db.export_excel, 'excavator_database.xlsx'),
+        ('json', "Exporting to JSON...", db.export_json, 'excavator_database.json'),
+        ('xml', "Exporting to XML...", db.export_xml, 'excavator_database.xml'),
+        ('pdf', "Exporting to PDF...", db.export_pdf, 'excavator_database.pdf'),
+        ('sqlite', "Creating SQLite database...", db.create_sqlite_database, 'excavator_database.db')
+    ]
+    selected = [e for e in exports if args.format in [e[0], 'all']]
     
-    if args.format in ['sqlite', 'all']:
-        print("Creating SQLite database...")
-        db.create_sqlite_database(output_dir / 'excavator_database.db')
+    # Exporters only read db.df, so independent formats can run side by side
+    with ThreadPoolExecutor(max_workers=len(selected)) as executor:
+        futures = []
+        for _, message, export, filename in selected:
+            print(message)
+            futures.append(executor.submit(export, output_dir / filename))
+        for future in futures:
+            future.result()
     
     # Generate visualizations
     if args.visualize:
@@ -0,0 +1,75 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+TOOLKIT_PATH = REPO_ROOT / 'excavator_database_toolkit (1).py'
+DATA_CSV = REPO_ROOT / 'excavator_database.csv'
+
+
+def _load_toolkit():
+    """Import the toolkit script, whose file name is not a valid module name"""
+    spec = importlib.util.spec_from_file_location('excavator_database_toolkit', TOOLKIT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope='session')
+def toolkit():
+    return _load_toolkit()
+
+
+@pytest.fixture(autouse=True)
+def _run_in_tmp_path(tmp_path, monkeypatch):
+    """Keep excavator_database.log and export files out of the repository"""
+    monkeypatch.chdir(tmp_path)
+
+
+@pytest.fixture
+def raw_df():
+    """The shipped CSV as read by plain pandas, i.e. the baseline's view of the data"""
+    return pd.read_csv(DATA_CSV)
+
+
+@pytest.fixture
+def write_csv(tmp_path):
+    def write(df, name='data.csv'):
+        path = tmp_path / name
+        df.to_csv(path, index=False)
+        return str(path)
+    return write
+
+
+def _late_populated(df):
+    df.loc[:150, 'Stick_Pin_Diameter_mm'] = np.nan
+    return df
+
+
+def _empty_column(column):
+    def build(df):
+        df[column] = np.nan
+        return df
+    return build
+
+
+# Inputs that have broken optimized code paths before, plus the shipped data itself
+DATA_CASES = {
+    'shipped': lambda df: df,
+    'header_only': lambda df: df.head(0),
+    'empty_manufacturer': _empty_column('Manufacturer'),
+    'empty_data_source': _empty_column('Data_Source'),
+    'empty_pin_diameter': _empty_column('Stick_Pin_Diameter_mm'),
+    'late_populated_pins': _late_populated,
+}
+
+
+@pytest.fixture(params=list(DATA_CASES))
+def case_csv(request, raw_df, write_csv):
+    """Path to a CSV for each entry of DATA_CASES"""
+    return write_csv(DATA_CASES[request.param](raw_df))
@@ -0,0 +1,243 @@
+"""
+Compare the optimized toolkit against straightforward pandas reference
+implementations of the original behaviour, on the shipped data and on
+degenerate inputs (see DATA_CASES in conftest.py).
+"""
+import json
+import re
+import sqlite3
+import xml.etree.ElementTree as ET
+from xml.dom import minidom
+
+import pandas as pd
+import pytest
+
+
+def reference_xml(df: pd.DataFrame, total_manufacturers: int) -> str:
+    """The original ElementTree + minidom export, without the ExportDate element"""
+    root = ET.Element("ExcavatorDatabase")
+    metadata = ET.SubElement(root, "Metadata")
+    ET.SubElement(metadata, "TotalRecords").text = str(len(df))
+    ET.SubElement(metadata, "TotalManufacturers").text = str(total_manufacturers)
+    ET.SubElement(metadata, "Version").text = "2024.1"
+    excavators = ET.SubElement(root, "Excavators")
+    for _, row in df.iterrows():
+        excavator = ET.SubElement(excavators, "Excavator")
+        for col in df.columns:
+            element = ET.SubElement(excavator, col.replace(' ', '_'))
+            element.text = str(row[col]) if pd.notna(row[col]) else ""
+    xml_str = minidom.parseString(ET.tostring(root)).toprettyxml(indent="  ")
+    return '\n'.join(line for line in xml_str.split('\n') if line.strip())
+
+
+def test_export_xml_matches_reference(toolkit, case_csv):
+    db = toolkit.ExcavatorDatabase(case_csv)
+    assert db.export_xml('out.xml')
+
+    with open('out.xml', encoding='utf-8') as f:
+        written = re.sub(r'\n *<ExportDate>[^<]*</ExportDate>', '', f.read())
+    baseline = pd.read_csv(case_csv)
+    assert written == reference_xml(baseline, baseline['Manufacturer'].nunique())
+
+
+@pytest.fixture(params=['pandas', 'polars'])
+def engine(request):
+    if request.param == 'polars':
+        pytest.importorskip('polars')
+    return request.param
+
+
+def test_export_csv_matches_reference(toolkit, case_csv, engine):
+    db = toolkit.ExcavatorDatabase(case_csv, engine=engine)
+    assert db.export_csv('out.csv')
+
+    with open('out.csv', encoding='utf-8') as f:
+        assert f.read() == pd.read_csv(case_csv).to_csv(index=False)
+
+
+def reference_search(df: pd.DataFrame, **kwargs) -> pd.DataFrame:
+    """
+    The original chained filters. Text is matched as a literal substring (as since
+    chunk0-5), and a column with no text at all matches nothing instead of raising.
+    """
+    def contains(values, text):
+        if not pd.api.types.is_string_dtype(values) or values.isna().all():
+            return pd.Series(False, index=values.index)
+        return values.str.contains(text, case=False, na=False, regex=False)
+
+    result = df.copy()
+    for key, column in (('manufacturer', 'Manufacturer'), ('model', 'Model')):
+        if kwargs.get(key):
+            result = result[contains(result[column], kwargs[key])]
+    if kwargs.get('pin_diameter_min'):
+        result = result[result['Stick_Pin_Diameter_mm'] >= kwargs['pin_diameter_min']]
+    if kwargs.get('pin_diameter_max'):
+        result = result[result['Stick_Pin_Diameter_mm'] <= kwargs['pin_diameter_max']]
+    if kwargs.get('data_source'):
+        result = result[contains(result['Data_Source'], kwargs['data_source'])]
+    return result
+
+
+SEARCHES = [
+    {},
+    {'manufacturer': 'cat'},
+    {'manufacturer': 'CATERPILLAR', 'model': '32'},
+    {'model': 'zx'},
+    {'pin_diameter_min': 45, 'pin_diameter_max': 90},
+    {'pin_diameter_min': 0, 'pin_diameter_max': 45.0},
+    {'manufacturer': 'komatsu', 'pin_diameter_min': 60, 'data_source': 'pdf'},
+    {'manufacturer': 'no such maker'},
+]
+
+
+@pytest.mark.parametrize('query', SEARCHES, ids=repr)
+def test_search_matches_reference(toolkit, case_csv, engine, query):
+    db = toolkit.ExcavatorDatabase(case_csv, engine=engine)
+    expected = reference_search(pd.read_csv(case_csv), **query)
+
+    found = db.search(**query)
+    assert found.index.tolist() == expected.index.tolist()
+    pd.testing.assert_frame_equal(found.astype(object), expected.astype(object), check_dtype=False)
+
+
+def reference_statistics(df: pd.DataFrame) -> dict:
+    """The original get_statistics() body, without the date_generated timestamp"""
+    pins = df['Stick_Pin_Diameter_mm'].dropna()
+    return {
+        "total_manufacturers": df['Manufacturer'].nunique(),
+        "manufacturers": df['Manufacturer'].value_counts().to_dict(),
+        "pin_diameter_distribution": {
+            "min": float(pins.min()),
+            "max": float(pins.max()),
+            "mean": float(pins.mean()),
+            "median": float(pins.median())
+        },
+        "data_sources": df['Data_Source'].value_counts().to_dict(),
+        "weight_classes": {
+            "Mini (< 6 tons)": int((pins <= 30).sum()),
+            "Compact (6-15 tons)": int(((pins > 30) & (pins <= 45)).sum()),
+            "Medium (15-30 tons)": int(((pins > 45) & (pins <= 65)).sum()),
+            "Large (30-50 tons)": int(((pins > 65) & (pins <= 90)).sum()),
+            "Heavy (50-80 tons)": int(((pins > 90) & (pins <= 120)).sum()),
+            "Ultra Heavy (> 80 tons)": int((pins > 120).sum())
+        }
+    }
+
+
+def test_statistics_match_reference(toolkit, case_csv, engine):
+    db = toolkit.ExcavatorDatabase(case_csv, engine=engine)
+    stats = db.get_statistics()
+    expected = reference_statistics(pd.read_csv(case_csv))
+
+    assert stats['overview']['total_manufacturers'] == expected['total_manufacturers']
+    # Compared as item lists: ties must keep the original value_counts() ranking
+    for key in ('manufacturers', 'data_sources', 'weight_classes'):
+        assert list(stats[key].items()) == list(expected[key].items())
+    distribution = stats['pin_diameter_distribution']
+    for key in ('min', 'max', 'median'):
+        assert distribution[key] == pytest.approx(expected['pin_diameter_distribution'][key], nan_ok=True, rel=0)
+    # The fused kernel sums sequentially, pandas pairwise
+    assert distribution['mean'] == pytest.approx(expected['pin_diameter_distribution']['mean'], nan_ok=True)
+
+
+def reference_validation(df: pd.DataFrame, required_columns: list) -> dict:
+    """The original validate_data() body"""
+    missing_values = {col: int(n) for col, n in df.isnull().sum().items() if n > 0}
+    duplicates = int(df.duplicated(subset=['Manufacturer', 'Model']).sum())
+    score = round((1 - sum(missing_values.values()) / (len(df) * len(df.columns))) * 100, 2)
+    missing_columns = [col for col in required_columns if col not in df.columns]
+    issues = []
+    if missing_columns:
+        issues.append(f"Missing required columns: {missing_columns}")
+    if duplicates > 0:
+        issues.append(f"Found {duplicates} duplicate records")
+    if score < 90:
+        issues.append(f"Data quality score below 90%: {score}%")
+    return {
+        "total_records": len(df),
+        "missing_columns": missing_columns,
+        "missing_values": missing_values,
+        "duplicate_records": duplicates,
+        "data_quality_score": score,
+        "issues": issues
+    }
+
+
+def test_validate_data_matches_reference(toolkit, case_csv):
+    db = toolkit.ExcavatorDatabase(case_csv)
+    try:
+        expected = reference_validation(pd.read_csv(case_csv), db.required_columns)
+    except ZeroDivisionError:
+        # The quality score of an empty file was never defined; keep failing the same way
+        with pytest.raises(ZeroDivisionError):
+            db.validate_data()
+        return
+
+    assert db.validate_data() == expected
+
+
+def test_export_json_matches_reference(toolkit, case_csv):
+    db = toolkit.ExcavatorDatabase(case_csv)
+    assert db.export_json('out.json')
+
+    baseline = pd.read_csv(case_csv)
+    # Missing values are written as null rather than the original non-standard NaN token
+    records = baseline.astype(object).where(baseline.notna(), None).to_dict('records')
+    expected = json.dumps({
+        "metadata": {
+            "total_records": len(baseline),
+            "total_manufacturers": baseline['Manufacturer'].nunique(),
+            "export_date": "",
+            "version": "2024.1"
+        },
+        "excavators": records
+    }, indent=2, ensure_ascii=False)
+    with open('out.json', encoding='utf-8') as f:
+        assert re.sub(r'"export_date": "[^"]*"', '"export_date": ""', f.read()) == expected
+
+
+def _sqlite_dump(path: str):
+    with sqlite3.connect(path) as conn:
+        schema = conn.execute("SELECT type, name, sql FROM sqlite_master ORDER BY name").fetchall()
+        rows = conn.execute("SELECT * FROM excavators").fetchall()
+    return schema, rows
+
+
+def test_sqlite_database_matches_reference(toolkit, case_csv):
+    db = toolkit.ExcavatorDatabase(case_csv)
+    assert db.create_sqlite_database('out.db')
+
+    with sqlite3.connect('reference.db') as conn:
+        pd.read_csv(case_csv).to_sql('excavators', conn, if_exists='replace', index=False)
+        conn.execute('CREATE INDEX idx_manufacturer ON excavators(Manufacturer)')
+        conn.execute('CREATE INDEX idx_model ON excavators(Model)')
+        conn.execute('CREATE INDEX idx_pin_diameter ON excavators(Stick_Pin_Diameter_mm)')
+    assert _sqlite_dump('out.db') == _sqlite_dump('reference.db')
+
+
+def reference_pdf_rows(df: pd.DataFrame) -> list:
+    """Data rows of the original export_pdf sample table"""
+    rows = []
+    for _, row in df.head(100).iterrows():
+        rows.append([str(row['Manufacturer'])[:15], str(row['Model'])[:15]] + [
+            str(row[col]) if pd.notna(row[col]) else '-'
+            for col in ('Stick_Pin_Diameter_mm', 'Stick_Pin_Diameter_inch', 'Stick_Width_mm', 'Link_Width_mm')
+        ])
+    return rows
+
+
+def test_export_pdf_table_matches_reference(toolkit, case_csv, monkeypatch):
+    pytest.importorskip('reportlab')
+    tables = []
+
+    class RecordingTable(toolkit.Table):
+        def __init__(self, data, *args, **kwargs):
+            tables.append(data)
+            super().__init__(data, *args, **kwargs)
+
+    monkeypatch.setattr(toolkit, 'Table', RecordingTable)
+    db = toolkit.ExcavatorDatabase(case_csv)
+    assert db.export_pdf('out.pdf')
+
+    # tables[0] is the statistics table; later entries are page splits of the sample table
+    assert tables[1][1:] == reference_pdf_rows(pd.read_csv(case_csv))
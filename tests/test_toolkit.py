@@ -0,0 +1,139 @@
+import json
+
+import numpy as np
+import pytest
+
+
+@pytest.mark.parametrize('column', ['Data_Source', 'Manufacturer'])
+def test_load_with_empty_label_column(toolkit, raw_df, write_csv, column):
+    raw_df[column] = np.nan
+    db = toolkit.ExcavatorDatabase(write_csv(raw_df))
+
+    assert db.df is not None
+    assert len(db.df) == len(raw_df)
+    assert len(db.search(model='zx')) == raw_df['Model'].str.contains('zx', case=False).sum()
+    assert db.search(**{column.lower(): 'a'}).empty
+    assert db.export_csv('out.csv')
+
+
+def test_search_ignores_empty_data_source(toolkit, raw_df, write_csv):
+    raw_df['Data_Source'] = np.nan
+    db = toolkit.ExcavatorDatabase(write_csv(raw_df))
+
+    assert len(db.search(manufacturer='cat')) == 81
+
+
+def test_load_header_only_file(toolkit, raw_df, write_csv):
+    db = toolkit.ExcavatorDatabase(write_csv(raw_df.head(0)))
+
+    assert db.df is not None
+    assert list(db.df.columns) == list(raw_df.columns)
+    # Same dtypes as the C engine gives an empty file, not pyarrow's float64
+    assert db.df['Model'].dtype == object
+    assert db.df['Stick_Pin_Diameter_mm'].dtype == object
+
+    stats = db.get_statistics()
+    assert stats['overview']['total_records'] == 0
+    assert stats['overview']['total_manufacturers'] == 0
+    assert np.isnan(stats['pin_diameter_distribution']['min'])
+    assert sum(stats['weight_classes'].values()) == 0
+    assert db.search(manufacturer='cat').empty
+    assert db.export_csv('out.csv')
+    assert db.export_xml('out.xml')
+    assert db.export_json('out.json')
+
+
+@pytest.mark.parametrize('late_rows', [150, None])
+def test_polars_engine_reads_late_populated_measurements(toolkit, raw_df, write_csv, late_rows):
+    pytest.importorskip('polars')
+    # Empty for the first 150 rows (beyond Polars' default inference window), or entirely
+    raw_df.loc[:late_rows, 'Stick_Pin_Diameter_mm'] = np.nan
+    db = toolkit.ExcavatorDatabase(write_csv(raw_df), engine='polars')
+
+    assert db.df['Stick_Pin_Diameter_mm'].dtype == np.float64
+    pins = raw_df['Stick_Pin_Diameter_mm']
+    assert len(db.search(pin_diameter_min=50)) == (pins >= 50).sum()
+    stats = db.get_statistics()
+    if pins.notna().any():
+        assert stats['pin_diameter_distribution']['max'] == pins.max()
+    else:
+        assert np.isnan(stats['pin_diameter_distribution']['max'])
+
+
+def test_statistics_follow_direct_df_assignment(toolkit, raw_df):
+    db = toolkit.ExcavatorDatabase()
+    db.df = raw_df
+
+    stats = db.get_statistics()
+    assert stats['overview']['total_manufacturers'] == raw_df['Manufacturer'].nunique()
+    assert stats['manufacturers'] == raw_df['Manufacturer'].value_counts().to_dict()
+    assert stats['data_sources'] == raw_df['Data_Source'].value_counts().to_dict()
+
+    db.df = raw_df[raw_df['Manufacturer'] == 'Komatsu'].reset_index(drop=True)
+    assert db.get_statistics()['manufacturers'] == {'Komatsu': 68}
+
+
+def test_duplicates_follow_direct_df_assignment(toolkit, raw_df):
+    db = toolkit.ExcavatorDatabase()
+    db.df = raw_df
+
+    expected = int(raw_df.duplicated(subset=['Manufacturer', 'Model']).sum())
+    assert expected == 1
+    assert db.validate_data()['duplicate_records'] == expected
+
+    db.df = raw_df.drop_duplicates(subset=['Manufacturer', 'Model'])
+    assert db.validate_data()['duplicate_records'] == 0
+
+
+def test_search_after_replacing_loaded_df(toolkit, raw_df, write_csv):
+    db = toolkit.ExcavatorDatabase(write_csv(raw_df))
+    assert len(db.search(manufacturer='cat')) == 81
+
+    # Plain text columns instead of the categoricals load_data produced
+    db.df = raw_df[raw_df['Manufacturer'] != 'Bobcat'].reset_index(drop=True)
+    assert len(db.search(manufacturer='cat')) == 81 - 33
+    assert len(db.search(data_source='pdf_page_1')) == db.df['Data_Source'].str.startswith('PDF_Page_1').sum()
+
+
+@pytest.fixture(params=[True, False], ids=['orjson', 'stdlib'])
+def json_backend(request, toolkit, monkeypatch):
+    if request.param:
+        pytest.importorskip('orjson')
+    monkeypatch.setattr(toolkit, 'ORJSON_AVAILABLE', request.param)
+
+
+def test_export_json_keeps_full_float_precision(toolkit, raw_df, write_csv, json_backend):
+    df = raw_df.head(3).copy()
+    df['Tip_Radius_mm'] = [1 / 3, 2 / 3, np.nan]
+    db = toolkit.ExcavatorDatabase(write_csv(df))
+    assert db.export_json('out.json')
+
+    text = open('out.json', encoding='utf-8').read()
+    assert text.startswith('{\n  "metadata": {\n    "total_records": 3,')
+    records = json.loads(text)['excavators']
+    assert [r['Tip_Radius_mm'] for r in records] == [1 / 3, 2 / 3, None]
+    assert records == json.loads(json.dumps(df.astype(object).where(df.notna(), None).to_dict('records')))
+
+
+def test_api_results_keep_full_float_precision(toolkit, raw_df, write_csv, json_backend):
+    pytest.importorskip('flask')
+    df = raw_df.head(2).copy()
+    df['Tip_Radius_mm'] = [1 / 3, np.nan]
+    api = toolkit.ExcavatorAPI(toolkit.ExcavatorDatabase(write_csv(df)))
+
+    body = api.app.test_client().get('/api/excavators').get_json()
+    assert body['success'] and body['count'] == 2
+    assert [r['Tip_Radius_mm'] for r in body['data']] == [1 / 3, None]
+
+
+def test_polars_engine_follows_direct_df_assignment(toolkit, raw_df, write_csv):
+    pytest.importorskip('polars')
+    db = toolkit.ExcavatorDatabase(write_csv(raw_df), engine='polars')
+    assert len(db.search(manufacturer='cat')) == 81
+
+    db.df = raw_df[raw_df['Stick_Pin_Diameter_mm'] > 60].reset_index(drop=True)
+    pins = db.df['Stick_Pin_Diameter_mm']
+    assert len(db.search(manufacturer='cat')) == db.df['Manufacturer'].str.contains('cat', case=False).sum()
+    assert db.get_statistics()['pin_diameter_distribution']['min'] == pins.min()
+    assert db.export_csv('out.csv')
+    assert open('out.csv', encoding='utf-8').read() == db.df.to_csv(index=False)